@@ -2,12 +2,20 @@
 SuperCollider OSC MCP Server for Claude integration.
 """
 
+import array
+import asyncio
+import collections
+import functools
+import itertools
 import random
+import re
+import socket
+import struct
 import time
 import json
-import math
+import numpy as np
 from mcp.server.fastmcp import FastMCP
-from pythonosc import udp_client
+from pythonosc import osc_bundle_builder, osc_message_builder, udp_client
 
 # Initialize the MCP server
 mcp = FastMCP("Super-Collider-OSC-MCP")
@@ -16,13 +24,222 @@ mcp = FastMCP("Super-Collider-OSC-MCP")
 DEFAULT_SC_IP = "127.0.0.1"
 DEFAULT_SC_PORT = 57110
 
+class _ConnectedUDPClient(udp_client.SimpleUDPClient):
+    """UDP client whose messages go out on a connected socket."""
+
+    def send(self, content):
+        _sc_send(content.dgram)
+
 # Create a global client that can be reused
-sc_client = udp_client.SimpleUDPClient(DEFAULT_SC_IP, DEFAULT_SC_PORT)
+sc_client = _ConnectedUDPClient(DEFAULT_SC_IP, DEFAULT_SC_PORT)
+
+# Enlarge the UDP send buffer so high-rate message bursts (granular
+# textures, LFO updates) don't fill the default buffer and block sends.
+# The OS may cap this below 4 MB (on Linux, raise net.core.wmem_max).
+sc_client._sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
+
+# Bind the peer address once so datagrams go out with send() rather than
+# sendto(); this skips the per-call address handling in the socket layer
+sc_client._sock.connect((DEFAULT_SC_IP, DEFAULT_SC_PORT))
+
+def _sc_send(dgram, _send=sc_client._sock.send):
+    """Send one raw datagram to scsynth on the connected socket."""
+    try:
+        _send(dgram)
+    except OSError:
+        # A connected UDP socket reports ICMP "port unreachable" from an
+        # earlier datagram on the next send. An unconnected sendto() never
+        # saw those, so keep the old behavior: scsynth being away should
+        # not crash a running tool
+        pass
+
+def build_msg(address, args):
+    """Build an OSC message from an address pattern and argument list."""
+    builder = osc_message_builder.OscMessageBuilder(address=address)
+    for arg in args:
+        builder.add_arg(arg)
+    return builder.build()
+
+def send_bundle(messages):
+    """
+    Send several OSC messages to SuperCollider as one immediate bundle.
+
+    Args:
+        messages (list): A list of (address, args) tuples.
+
+    Related messages share a single UDP datagram, so a beat's worth of
+    /s_new and /n_free traffic costs one sendto() syscall instead of one
+    per message.
+    """
+    if not messages:
+        return
+    bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+    for address, args in messages:
+        bundle.add_content(build_msg(address, args))
+    _sc_send(bundle.build().dgram)
+
+def send_timed_bundle(timestamp, messages):
+    """
+    Send OSC messages in a bundle scheduled for an absolute wall-clock time.
+
+    Args:
+        timestamp (float): Unix time at which scsynth should dispatch.
+        messages (list): A list of (address, args) tuples.
+
+    scsynth executes time-tagged bundles on its own sample clock, so
+    scheduled events don't inherit Python/OS sleep jitter.
+    """
+    if not messages:
+        return
+    bundle = osc_bundle_builder.OscBundleBuilder(timestamp)
+    for address, args in messages:
+        bundle.add_content(build_msg(address, args))
+    _sc_send(bundle.build().dgram)
+
+# Raw pre-serialized OSC templates for the grain hot path. Every grain
+# sends the same /s_new shape ("default", nid, 0, 0, "freq", f, "amp", a,
+# "pan", p), so the address, type tags, and argument-name strings are
+# baked into a constant prefix and only the varying bytes are packed per
+# message -- no OscMessageBuilder work per grain.
+_SNEW_DEFAULT_HEADER = b"/s_new\x00\x00,siiisfsfsf\x00default\x00"
+_SNEW_DEFAULT_ARGS = struct.Struct(">iii8sf4sf4sf")
+_NFREE_HEADER = b"/n_free\x00,i\x00\x00"
+_NFREE_ARG = struct.Struct(">i")
+_BUNDLE_HEADER = b"#bundle\x00\x00\x00\x00\x00\x00\x00\x00\x01"  # Immediate time tag
+_BUNDLE_SIZE = struct.Struct(">i")
+
+def _osc_string(s):
+    """Encode a string with OSC's null-terminated 4-byte padding."""
+    raw = s.encode("ascii")
+    return raw + b"\x00" * (4 - len(raw) % 4)
+
+# Template for /n_set messages that retune one float parameter on a fixed
+# node: everything up to the value is constant for a given (node, param),
+# so per-update serialization is a concat of prefix + 4 packed bytes.
+_NSET_FLOAT_HEADER = b"/n_set\x00\x00,isf\x00\x00\x00\x00"
+_FLOAT_ARG = struct.Struct(">f")
+
+def nset_float_template(node_id, param):
+    """Pre-serialize the constant prefix of a single-float /n_set."""
+    return _NSET_FLOAT_HEADER + _NFREE_ARG.pack(node_id) + _osc_string(param)
+
+# Variant without pan, for voices that only set freq and amp. The node id
+# sits at a fixed offset right after the header, so repeated hits can be
+# pre-serialized once and have just those 4 bytes spliced per hit.
+_SNEW_FREQ_AMP_HEADER = b"/s_new\x00\x00,siiisfsf\x00\x00\x00default\x00"
+_SNEW_FREQ_AMP_ARGS = struct.Struct(">iii8sf4sf")
+_SNEW_NODE_ID_OFFSET = len(_SNEW_FREQ_AMP_HEADER)
+
+def snew_freq_amp_template(freq, amp, target=0):
+    """Pre-serialize a freq/amp /s_new for the default synth, node id zeroed."""
+    return _SNEW_FREQ_AMP_HEADER + _SNEW_FREQ_AMP_ARGS.pack(
+        0, 0, target, b"freq", freq, b"amp", amp)
+
+def fill_node_id(template, node_id):
+    """Return a copy of a pre-serialized /s_new with node_id spliced in."""
+    dgram = bytearray(template)
+    dgram[_SNEW_NODE_ID_OFFSET:_SNEW_NODE_ID_OFFSET + 4] = _NFREE_ARG.pack(node_id)
+    return bytes(dgram)
+
+def snew_default_dgram(node_id, freq, amp, pan):
+    """Serialize a freq/amp/pan /s_new for the default synth to raw bytes."""
+    return _SNEW_DEFAULT_HEADER + _SNEW_DEFAULT_ARGS.pack(
+        node_id, 0, 0, b"freq", freq, b"amp", amp, b"pan", pan)
+
+def nfree_dgram(node_id):
+    """Serialize a single-node /n_free to raw bytes."""
+    return _NFREE_HEADER + _NFREE_ARG.pack(node_id)
+
+def send_raw_dgrams(dgrams):
+    """Send pre-serialized OSC messages as one immediate bundle."""
+    if not dgrams:
+        return
+    parts = [_BUNDLE_HEADER]
+    for dgram in dgrams:
+        parts.append(_BUNDLE_SIZE.pack(len(dgram)))
+        parts.append(dgram)
+    _sc_send(b"".join(parts))
+
+# NTP timetags: seconds since 1900 plus a 32-bit fraction
+_NTP_EPOCH_OFFSET = 2208988800
+_TIMETAG = struct.Struct(">II")
+
+def send_raw_timed_dgrams(groups):
+    """
+    Send pre-serialized OSC messages grouped under absolute timestamps.
+
+    Args:
+        groups (list): A list of (timestamp, dgrams) tuples.
+
+    Each group becomes a time-tagged bundle nested inside one immediate
+    outer bundle, so a whole stretch of scheduled events costs a single
+    send and scsynth keeps the fine timing.
+    """
+    if not groups:
+        return
+    parts = [_BUNDLE_HEADER]
+    for timestamp, dgrams in groups:
+        ntp = timestamp + _NTP_EPOCH_OFFSET
+        seconds = int(ntp)
+        inner = [b"#bundle\x00", _TIMETAG.pack(seconds, int((ntp - seconds) * 4294967296))]
+        for dgram in dgrams:
+            inner.append(_BUNDLE_SIZE.pack(len(dgram)))
+            inner.append(dgram)
+        inner = b"".join(inner)
+        parts.append(_BUNDLE_SIZE.pack(len(inner)))
+        parts.append(inner)
+    _sc_send(b"".join(parts))
+
+def free_nodes(node_ids):
+    """
+    Free several synth nodes with a single /n_free message.
+
+    scsynth accepts multiple node IDs in one /n_free, so bulk cleanup
+    costs one packet instead of one per node.
+    """
+    node_ids = list(node_ids)
+    if node_ids:
+        sc_client.send_message("/n_free", node_ids)
+
+def _clamp(value, lo, hi, cast=float):
+    """Coerce value with cast and clamp it to the inclusive [lo, hi] range."""
+    value = cast(value)
+    return lo if value < lo else (hi if value > hi else value)
+
+# Tokenizer for create_sequence patterns: note name plus a trailing run
+# of "_" (shorter) or "+" (longer) duration modifiers
+_SEQ_TOKEN_RE = re.compile(r"^(.*?)([_+]*)$")
+
+# Process-wide node ID allocator. The old time-based scheme repeated
+# whenever two calls landed in the same 10 ms window; a counter is unique
+# by construction. Each call gets the base of a 10000-wide block, which
+# comfortably covers every offset the tools derive from a base id (drum
+# voices carve +1000/+2000, the pattern group sits at +5000, and the
+# other tools count upward per note or grain). Wraps long before int32
+# overflows, after 200000 allocations.
+_node_id_blocks = itertools.count()
 
-# Helper function to manage node IDs
 def get_node_id():
-    """Generate a semi-random node ID to avoid conflicts."""
-    return int(time.time() * 100) % 10000 + 1000
+    """Allocate the base of a fresh block of node IDs."""
+    return 1000 + (next(_node_id_blocks) % 200000) * 10000
+
+# Long-running performances playing in the background, keyed by run id
+_active_performances = {}
+_performance_ids = itertools.count(1)
+
+def _start_performance(label, coro):
+    """Run a performance coroutine as a background task; returns its run id."""
+    run_id = f"{label}-{next(_performance_ids)}"
+    task = asyncio.create_task(coro)
+    _active_performances[run_id] = task
+    task.add_done_callback(lambda _task: _active_performances.pop(run_id, None))
+    return run_id
+
+# Note frequency table indexed by MIDI number (A4 = MIDI note 69 =
+# 440 Hz), built once at import so note and chord math is an index
+# instead of a pow(). 132 entries, so it reaches B9 (MIDI 131), the
+# highest name the note helpers can spell
+FREQ_TABLE = tuple(440.0 * (2.0 ** ((midi - 69) / 12.0)) for midi in range(132))
 
 # Note name to frequency conversion helpers
 NOTE_TO_SEMITONE = {
@@ -31,26 +248,192 @@ NOTE_TO_SEMITONE = {
     "A": 0, "A#": 1, "Bb": 1, "B": 2
 }
 
+# Every note name the tools can reference ("C0" through "B9"), mapped to
+# its frequency at import time so note_to_freq is a single dict lookup
+# with no per-call parsing
+_NOTE_FREQ = {
+    f"{name}{octave}": FREQ_TABLE[69 + semitone + (octave - 4) * 12]
+    for name, semitone in NOTE_TO_SEMITONE.items()
+    for octave in range(10)
+}
+
 def note_to_freq(note):
     """Convert a note name (e.g., 'C4', 'A#3') to frequency in Hz."""
     if isinstance(note, (int, float)):
         return float(note)
 
-    if not isinstance(note, str) or len(note) < 2:
+    if not isinstance(note, str):
         return 440.0  # Default to A4
 
-    note_name = note[:-1]
-    try:
-        octave = int(note[-1])
-        if note_name in NOTE_TO_SEMITONE:
-            # Calculate semitones from A4
-            semitones = NOTE_TO_SEMITONE[note_name] + (octave - 4) * 12
-            # Convert to frequency (A4 = 440Hz)
-            return 440.0 * (2 ** (semitones / 12))
-    except (ValueError, IndexError):
-        pass
+    return _NOTE_FREQ.get(note, 440.0)  # Default to A4 if unrecognized
+
+# Predefined drum patterns (1 = hit, 0 = rest), shared across calls
+DRUM_PATTERNS = {
+    "four_on_floor": {
+        "kick":     (1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0),
+        "snare":    (0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0),
+        "hihat":    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+    },
+    "breakbeat": {
+        "kick":     (1, 0, 0, 1, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0),
+        "snare":    (0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 1, 0, 1),
+        "hihat":    (1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 0, 1, 0),
+    },
+    "shuffle": {
+        "kick":     (1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0),
+        "snare":    (0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0),
+        "hihat":    (1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0),
+    }
+}
+
+# The same patterns flattened once into 16-bit step masks (step 0 in the
+# high bit), which is what the beat loop actually tests
+DRUM_PATTERN_MASKS = {
+    name: tuple(int("".join(str(step) for step in voices[voice]), 2)
+                for voice in ("kick", "snare", "hihat"))
+    for name, voices in DRUM_PATTERNS.items()
+}
+
+# Map chord names to note intervals (from root)
+CHORD_TYPES = {
+    # Major triad
+    "": [0, 4, 7],  # Root, major third, perfect fifth
+    "M": [0, 4, 7],
+    "maj": [0, 4, 7],
+
+    # Minor triad
+    "m": [0, 3, 7],  # Root, minor third, perfect fifth
+    "min": [0, 3, 7],
+
+    # Seventh chords
+    "7": [0, 4, 7, 10],  # Dominant seventh
+    "M7": [0, 4, 7, 11],  # Major seventh
+    "maj7": [0, 4, 7, 11],
+    "m7": [0, 3, 7, 10],  # Minor seventh
+    "min7": [0, 3, 7, 10],
+    "dim": [0, 3, 6],  # Diminished
+    "dim7": [0, 3, 6, 9],  # Diminished seventh
+    "aug": [0, 4, 8],  # Augmented
+
+    # Suspended chords
+    "sus2": [0, 2, 7],  # Suspended 2nd
+    "sus4": [0, 5, 7],  # Suspended 4th
+
+    # Add chords
+    "add9": [0, 4, 7, 14],  # Added 9th
+    "add11": [0, 4, 7, 17],  # Added 11th
+
+    # Power chord
+    "5": [0, 7],  # Root and fifth
+}
+
+# Map notes to semitones from C
+ROOT_TO_SEMITONE = {
+    "C": 0, "C#": 1, "Db": 1, "D": 2, "D#": 3, "Eb": 3,
+    "E": 4, "F": 5, "F#": 6, "Gb": 6, "G": 7, "G#": 8, "Ab": 8,
+    "A": 9, "A#": 10, "Bb": 10, "B": 11
+}
+
+# Precomputed chord frequencies, built once at import time.
+# Maps (root, chord_type) -> tuple of frequencies so the progression
+# loop is a single dict lookup instead of a parse + pow() per note.
+CHORD_FREQS = {
+    (root, chord_type): tuple(
+        # Roots voice into the octave around middle C (MIDI 60)
+        FREQ_TABLE[60 + root_semitone + interval]
+        for interval in intervals
+    )
+    for root, root_semitone in ROOT_TO_SEMITONE.items()
+    for chord_type, intervals in CHORD_TYPES.items()
+}
+
+# Normalized layer parameters for create_layered_synth, one entry per
+# supported layer count. Offsets span [-1, 1] (scaled by the runtime
+# detune), amps make the center layer(s) loudest, and pans fan the
+# layers across the stereo field from -0.8 to 0.8.
+LAYER_TABLES = {
+    n: (
+        np.array([i / (n - 1) * 2.0 - 1.0 for i in range(n)]) if n > 1 else np.zeros(1),
+        0.3 * (1.0 - (np.abs(np.arange(n) - (n - 1) / 2) / max(n - 1, 1)) * 0.5),
+        np.array([-0.8 + i / (n - 1) * 1.6 for i in range(n)]) if n > 1 else np.zeros(1),
+    )
+    for n in range(1, 6)
+}
+
+# Voicing styles for create_chord_progression. Each entry drives the single
+# playback body in that tool: a per-note amplitude rule, the total stereo
+# spread (0 = no pan argument), the fraction of the duration to hold, whether
+# notes play sequentially, and an optional subset of intervals to voice.
+CHORD_STYLES = {
+    "pad": {
+        # All notes together with slow attack; edges slightly louder
+        "amp": lambda i, n: 0.3 if i == 0 or i == n - 1 else 0.2,
+        "pan_spread": 1.6,
+        "hold": 1.0,
+        "arpeggio": False,
+        "intervals": None,
+    },
+    "staccato": {
+        # All notes together but shorter and louder
+        "amp": lambda i, n: 0.4 if i == 0 or i == n - 1 else 0.3,
+        "pan_spread": 1.2,
+        "hold": 0.25,
+        "arpeggio": False,
+        "intervals": None,
+    },
+    "arpeggio": {
+        # Notes play in sequence
+        "amp": lambda i, n: 0.3,
+        "pan_spread": 0.0,
+        "hold": 0.9,
+        "arpeggio": True,
+        "intervals": None,
+    },
+    "power": {
+        # Just root and fifth, louder
+        "amp": lambda i, n: 0.5 if i == 0 else 0.4,
+        "pan_spread": 0.0,
+        "hold": 1.0,
+        "arpeggio": False,
+        "intervals": (0, 7),
+    },
+}
 
-    return 440.0  # Default to A4 if parsing fails
+@functools.lru_cache(maxsize=128)
+def _parse_progression(progression):
+    """
+    Parse a chord progression string into ((name, intervals, freqs), ...).
+
+    Unrecognized or empty chord names get empty intervals/freqs and are
+    treated as rests by the playback loop. Cached so repeated progressions
+    skip the parse entirely.
+    """
+    parsed = []
+    for chord_name in progression.split("-"):
+        root_note = ""
+        chord_type = ""
+
+        # Check for flat/sharp notes first (they have 2 characters)
+        if len(chord_name) >= 2 and chord_name[0:2] in ROOT_TO_SEMITONE:
+            root_note = chord_name[0:2]
+            chord_type = chord_name[2:]
+        elif chord_name:
+            root_note = chord_name[0:1]
+            chord_type = chord_name[1:]
+
+        if root_note in ROOT_TO_SEMITONE:
+            # Default to major if the chord type is not recognized
+            if chord_type not in CHORD_TYPES:
+                chord_type = ""
+            intervals = tuple(CHORD_TYPES[chord_type])
+            frequencies = CHORD_FREQS[(root_note, chord_type)]
+        else:
+            intervals = ()
+            frequencies = ()
+
+        parsed.append((chord_name, intervals, frequencies))
+
+    return tuple(parsed)
 
 @mcp.tool()
 async def play_example_osc():
@@ -63,14 +446,14 @@ async def play_example_osc():
     # Create a simple sine wave synth
     node_id = get_node_id()
     sc_client.send_message("/s_new", ["default", node_id, 0, 0, "freq", 440, "amp", 0.5])
-    time.sleep(1)
+    await asyncio.sleep(1)
 
     # Change the frequency a few times
     for x in range(10):
         freq = 300 + random.random() * 700
         # /n_set sets parameters on an existing synth
         sc_client.send_message("/n_set", [node_id, "freq", freq])
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
 
     # Free the synth when done
     sc_client.send_message("/n_free", [node_id])
@@ -90,67 +473,94 @@ async def play_melody(scale="major", tempo=120):
     if scale not in ["major", "minor", "pentatonic", "blues"]:
         scale = "major"
 
-    tempo = max(60, min(240, int(tempo)))  # Clamp between 60-240 BPM
+    tempo = _clamp(tempo, 60, 240, cast=int)  # Clamp between 60-240 BPM
     
     # Define scale patterns (semitones from root)
     scales = {
-        "major": [0, 2, 4, 5, 7, 9, 11, 12],
-        "minor": [0, 2, 3, 5, 7, 8, 10, 12],
-        "pentatonic": [0, 2, 4, 7, 9, 12],
-        "blues": [0, 3, 5, 6, 7, 10, 12]
+        "major": (0, 2, 4, 5, 7, 9, 11, 12),
+        "minor": (0, 2, 3, 5, 7, 8, 10, 12),
+        "pentatonic": (0, 2, 4, 7, 9, 12),
+        "blues": (0, 3, 5, 6, 7, 10, 12)
     }
 
     # Base frequency (A4 = 440Hz)
     base_freq = 440
 
-    # Generate a melody
+    # Generate a melody, drawing everything from one local generator so
+    # the loop never goes through the module-level random instance
+    rng = np.random.default_rng()
     note_count = 16
-    root_note = random.randint(0, 11)  # Random root note
-    octave = random.randint(0, 2)      # Random octave (0, 1, or 2)
+    root_note = int(rng.integers(0, 12))  # Random root note
+    octave = int(rng.integers(0, 3))      # Random octave (0, 1, or 2)
 
     # Time between notes in seconds
     note_duration = 60 / tempo
 
-    # Create a melody pattern
-    melody = []
-    for i in range(note_count):
-        # Select a note from the scale
-        scale_degree = random.randint(0, len(scales[scale])-1)
-        note = root_note + scales[scale][scale_degree] + (octave * 12)
-
-        # Convert to frequency (equal temperament)
-        freq = base_freq * (2 ** ((note - 9) / 12))
+    # Create a melody pattern: draw all scale degrees and durations at
+    # once and compute the frequencies in one vectorized pass
+    scale_notes = scales[scale]
+    scale_arr = np.array(scale_notes)
+    notes = root_note + scale_arr[rng.integers(0, len(scale_arr), note_count)] + (octave * 12)
 
-        # Duration (whole, half, quarter notes)
-        duration_options = [0.25, 0.5, 1.0]
-        duration_weights = [0.5, 0.3, 0.2]  # More likely to use shorter notes
-        duration = random.choices(duration_options, duration_weights)[0] * note_duration
+    # Convert to frequency (equal temperament)
+    freqs = base_freq * np.exp2((notes - 9) / 12.0)
 
-        melody.append((freq, duration))
+    # Duration (whole, half, quarter notes; more likely to use shorter notes)
+    durations = rng.choice([0.25, 0.5, 1.0], size=note_count, p=[0.5, 0.3, 0.2]) * note_duration
 
-    # Play the melody
+    # Planning pass: lay out the whole performance -- melody followed by
+    # the scale run-down -- as one (offset, address, args) timeline. Each
+    # note boundary pairs the previous note's /n_free with the next
+    # note's /s_new at the same offset, so they share a bundle.
     synth_id = get_node_id()
-    for i, (freq, duration) in enumerate(melody):
-        # Create a new synth for each note
+    previous_id = None
+    plan = []
+    offset = 0.0
+
+    for i in range(note_count):
+        # Create a new synth for each note, straight from the frequency
+        # and duration arrays (no intermediate pair list)
         current_id = synth_id + i
-        sc_client.send_message("/s_new", ["default", current_id, 0, 0, "freq", freq, "amp", 0.3])
-        time.sleep(duration)
-        sc_client.send_message("/n_free", [current_id])
-    
+        plan.append((offset, "/s_new", ["default", current_id, 0, 0, "freq", freqs[i], "amp", 0.3]))
+        if previous_id is not None:
+            plan.append((offset, "/n_free", [previous_id]))
+        offset += durations[i]
+        previous_id = current_id
+
     # Play the scale to finish
-    for i, semitones in enumerate(scales[scale]):
+    for i, semitones in enumerate(scale_notes):
         # Calculate frequency
         freq = base_freq * (2 ** (semitones / 12))
-        
-        # Play the note
+
+        # Play the note, releasing the previous one at the same moment
         current_id = synth_id + note_count + i
-        sc_client.send_message("/s_new", ["default", current_id, 0, 0, "freq", freq, "amp", 0.3])
-        
-        # Wait for the note duration
-        time.sleep(note_duration * 0.9)  # Slightly shorter for legato effect
-        
-        # Free the node
-        sc_client.send_message("/n_free", [current_id])
+        plan.append((offset, "/s_new", ["default", current_id, 0, 0, "freq", freq, "amp", 0.3]))
+        plan.append((offset, "/n_free", [previous_id]))
+        offset += note_duration * 0.9  # Slightly shorter for legato effect
+        previous_id = current_id
+
+    # Free the final note
+    plan.append((offset, "/n_free", [previous_id]))
+    total_duration = offset
+
+    # Emission pass: same scheme as the sequence and chord tools -- each
+    # batch of same-offset events leaves as one time-tagged bundle a
+    # little ahead of its onset, and scsynth keeps the fine timing
+    send_ahead = 0.2
+    wall_start = time.time() + 0.05  # Small allowance for send latency
+    mono_start = time.monotonic()
+
+    for event_offset, events in itertools.groupby(plan, key=lambda event: event[0]):
+        sleep_for = (event_offset - send_ahead) - (time.monotonic() - mono_start)
+        if sleep_for > 0:
+            await asyncio.sleep(sleep_for)
+        send_timed_bundle(wall_start + event_offset,
+                          [(address, args) for _, address, args in events])
+
+    # Wait out the performance
+    remaining = total_duration - (time.monotonic() - mono_start)
+    if remaining > 0:
+        await asyncio.sleep(remaining)
 
     return f"Successfully played a {scale} scale melody at {tempo} BPM"
 
@@ -168,45 +578,18 @@ async def create_drum_pattern(pattern_type="four_on_floor", beats=16, tempo=120)
     if pattern_type not in ["four_on_floor", "breakbeat", "shuffle", "random"]:
         pattern_type = "four_on_floor"
 
-    beats = max(4, min(32, int(beats)))  # Clamp between 4-32 beats
-    tempo = max(60, min(240, int(tempo)))  # Clamp between 60-240 BPM
+    beats = _clamp(beats, 4, 32, cast=int)  # Clamp between 4-32 beats
+    tempo = _clamp(tempo, 60, 240, cast=int)  # Clamp between 60-240 BPM
     
-    # Define predefined patterns (1 = hit, 0 = rest)
-    patterns = {
-        "four_on_floor": {
-            "kick":     [1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0],
-            "snare":    [0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0],
-            "hihat":    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-        },
-        "breakbeat": {
-            "kick":     [1, 0, 0, 1, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0],
-            "snare":    [0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 1, 0, 1],
-            "hihat":    [1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 0, 1, 0],
-        },
-        "shuffle": {
-            "kick":     [1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0],
-            "snare":    [0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0],
-            "hihat":    [1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0],
-        }
-    }
-
-    # For random pattern, generate one
+    # For random pattern, draw each voice's 16 steps as one 16-bit mask;
+    # empty kick/snare draws fall back to a downbeat kick and a beat-4
+    # snare, like the old per-step fixups
     if pattern_type == "random":
-        patterns["random"] = {
-            "kick": [random.choice([0, 1]) for _ in range(16)],
-            "snare": [random.choice([0, 1]) for _ in range(16)],
-            "hihat": [random.choice([0, 1]) for _ in range(16)]
-        }
-        # Ensure at least some beats
-        if sum(patterns["random"]["kick"]) == 0:
-            patterns["random"]["kick"][0] = 1
-        if sum(patterns["random"]["snare"]) == 0:
-            patterns["random"]["snare"][4] = 1
-
-        pattern_type = "random"
-
-    # Select the pattern
-    pattern = patterns[pattern_type]
+        kick_mask = random.getrandbits(16) or 0x8000
+        snare_mask = random.getrandbits(16) or 0x0800
+        hihat_mask = random.getrandbits(16)
+    else:
+        kick_mask, snare_mask, hihat_mask = DRUM_PATTERN_MASKS[pattern_type]
 
     # Time between beats in seconds
     beat_duration = 60 / tempo
@@ -214,33 +597,52 @@ async def create_drum_pattern(pattern_type="four_on_floor", beats=16, tempo=120)
     # Base node ID
     base_id = get_node_id()
 
-    # Play the drum pattern
+    # All hits spawn inside one group, so whatever is still sounding when
+    # the pattern ends (or the tool is interrupted) dies with a single
+    # /g_freeAll instead of needing per-node bookkeeping
+    group_id = base_id + 5000
+    sc_client.send_message("/g_new", [group_id, 0, 0])
+
+    # Each voice's /s_new differs between hits only by node id, so
+    # serialize each one once and splice the id in per hit
+    kick_template = snew_freq_amp_template(60, 0.5, group_id)    # Low frequency sine with quick decay
+    snare_template = snew_freq_amp_template(300, 0.3, group_id)  # Mid frequency with noise
+    hihat_template = snew_freq_amp_template(1200, 0.2, group_id)  # High frequency
+
+    # Play the drum pattern, with each beat's hits in a single bundle so
+    # the drums trigger together and cost one datagram instead of one per
+    # voice (ditto the frees after the beat)
+    t0 = time.monotonic()
+
     for beat in range(beats):
-        beat_idx = beat % 16  # Loop the pattern if beats > 16
+        bit = 1 << (15 - beat % 16)  # Loop the pattern if beats > 16
+
+        # Collect each drum sound that hits on this beat
+        hits = []
+        dgrams = []
+        if kick_mask & bit:
+            hits.append(base_id + beat)
+            dgrams.append(fill_node_id(kick_template, hits[-1]))
+
+        if snare_mask & bit:
+            hits.append(base_id + 1000 + beat)
+            dgrams.append(fill_node_id(snare_template, hits[-1]))
 
-        # Play each drum sound if it's a hit
-        if pattern["kick"][beat_idx]:
-            # Kick drum (low frequency sine with quick decay)
-            sc_client.send_message("/s_new", ["default", base_id + beat, 0, 0, "freq", 60, "amp", 0.5])
+        if hihat_mask & bit:
+            hits.append(base_id + 2000 + beat)
+            dgrams.append(fill_node_id(hihat_template, hits[-1]))
 
-        if pattern["snare"][beat_idx]:
-            # Snare (mid frequency with noise)
-            sc_client.send_message("/s_new", ["default", base_id + 1000 + beat, 0, 0, "freq", 300, "amp", 0.3])
+        send_raw_dgrams(dgrams)
 
-        if pattern["hihat"][beat_idx]:
-            # Hi-hat (high frequency)
-            sc_client.send_message("/s_new", ["default", base_id + 2000 + beat, 0, 0, "freq", 1200, "amp", 0.2])
+        # Wait until this beat's absolute deadline, so per-beat send time
+        # doesn't accumulate as drift across the pattern
+        await asyncio.sleep(max(0.0, t0 + (beat + 1) * beat_duration - time.monotonic()))
 
-        # Wait for the next beat
-        time.sleep(beat_duration)
+        # Free all synths from this beat with one /n_free
+        free_nodes(hits)
 
-        # Free all synths from this beat
-        if pattern["kick"][beat_idx]:
-            sc_client.send_message("/n_free", [base_id + beat])
-        if pattern["snare"][beat_idx]:
-            sc_client.send_message("/n_free", [base_id + 1000 + beat])
-        if pattern["hihat"][beat_idx]:
-            sc_client.send_message("/n_free", [base_id + 2000 + beat])
+    # Tear down the group (and any synth that slipped past its beat free)
+    send_bundle([("/g_freeAll", [group_id]), ("/n_free", [group_id])])
 
     return f"Successfully played a {pattern_type} drum pattern with {beats} beats at {tempo} BPM"
 
@@ -260,8 +662,8 @@ async def play_synth(synth_type="sine", note="A4", duration=2.0, volume=0.5, eff
     frequency = note_to_freq(note)
     
     # Validate parameters
-    volume = max(0.0, min(1.0, float(volume)))
-    duration = max(0.1, min(30.0, float(duration)))
+    volume = _clamp(volume, 0.0, 1.0)
+    duration = _clamp(duration, 0.1, 30.0)
     
     # Create a node ID
     node_id = get_node_id()
@@ -276,7 +678,7 @@ async def play_synth(synth_type="sine", note="A4", duration=2.0, volume=0.5, eff
             if isinstance(effect_dict, dict):
                 for effect in ["reverb", "delay", "distortion", "filter"]:
                     if effect in effect_dict:
-                        value = max(0, min(1, float(effect_dict[effect])))
+                        value = _clamp(effect_dict[effect], 0, 1)
                         params.extend([effect, value])
         except (json.JSONDecodeError, ValueError, TypeError):
             pass
@@ -302,7 +704,7 @@ async def play_synth(synth_type="sine", note="A4", duration=2.0, volume=0.5, eff
     sc_client.send_message("/s_new", [synth_name, node_id, 0, 0] + params)
     
     # Wait for the specified duration
-    time.sleep(duration)
+    await asyncio.sleep(duration)
     
     # Free the synth
     sc_client.send_message("/n_free", [node_id])
@@ -322,8 +724,8 @@ async def create_sequence(pattern, synth="sine", tempo=120, repeats=1):
         repeats: Number of times to repeat the pattern (1-8)
     """
     # Validate inputs
-    tempo = max(60, min(240, int(tempo)))
-    repeats = max(1, min(8, int(repeats)))
+    tempo = _clamp(tempo, 60, 240, cast=int)
+    repeats = _clamp(repeats, 1, 8, cast=int)
     
     # Calculate beat duration in seconds
     beat_duration = 60 / tempo
@@ -331,62 +733,87 @@ async def create_sequence(pattern, synth="sine", tempo=120, repeats=1):
     # Parse the pattern
     notes = pattern.split("-") if "-" in pattern else [c for c in pattern]
     
-    # Process each note
-    structured_notes = []
+    # Process each note into structure-of-arrays form: a flag byte per
+    # step plus parallel frequency/duration arrays, instead of one dict
+    # allocation per step
+    note_flags = bytearray()
+    note_freqs = array.array("d")
+    note_durs = array.array("d")
+
     for note_str in notes:
         # Check for rest
         if note_str == "." or not note_str:
-            structured_notes.append({"type": "rest", "duration": beat_duration})
+            note_flags.append(0)
+            note_freqs.append(0.0)
+            note_durs.append(beat_duration)
             continue
         
-        # Check for duration modifiers
-        duration_mod = 1.0
-        note_name = note_str
+        # Split the token into note name and trailing duration modifiers
+        # in one regex pass (no repeated count/replace scans)
+        note_name, modifiers = _SEQ_TOKEN_RE.match(note_str).groups()
         
-        if "_" in note_str:  # Shorter notes
-            count = note_str.count("_")
-            duration_mod = 1.0 / (count + 1)
-            note_name = note_str.replace("_", "")
-        elif "+" in note_str:  # Longer notes
-            count = note_str.count("+")
-            duration_mod = 1.0 + (count * 0.5)  # Each + adds 50% more duration
-            note_name = note_str.replace("+", "")
+        if modifiers.startswith("_"):  # Shorter notes
+            duration_mod = 1.0 / (len(modifiers) + 1)
+        elif modifiers:  # Longer notes; each + adds 50% more duration
+            duration_mod = 1.0 + (len(modifiers) * 0.5)
+        else:
+            duration_mod = 1.0
         
         # Convert note to frequency
         frequency = note_to_freq(note_name)
         if frequency > 0:
-            structured_notes.append({
-                "type": "note",
-                "frequency": frequency,
-                "duration": beat_duration * duration_mod
-            })
+            note_flags.append(1)
+            note_freqs.append(frequency)
+            note_durs.append(beat_duration * duration_mod)
         else:
-            structured_notes.append({"type": "rest", "duration": beat_duration})
+            note_flags.append(0)
+            note_freqs.append(0.0)
+            note_durs.append(beat_duration)
     
     # Base node ID
     base_id = get_node_id()
     
-    # Play the sequence
+    # Planning pass: lay out every onset and release across all repeats
+    # as (offset, address, args) events; the emission loop below is then
+    # nothing but sleeps and OSC sends
+    synth_name = "default"  # Default for sine
+    plan = []
+    offset = 0.0
+
     for repeat in range(repeats):
-        for i, note_data in enumerate(structured_notes):
-            if note_data["type"] == "note":
-                # Create the synth
+        for i, is_note in enumerate(note_flags):
+            if is_note:
                 node_id = base_id + (repeat * 100) + i
-                
-                # Send message to create the synth
-                synth_name = "default"  # Default for sine
-                sc_client.send_message("/s_new", [synth_name, node_id, 0, 0, 
-                                             "freq", note_data["frequency"], 
-                                             "amp", 0.3])
-                
-                # Wait for the note duration
-                time.sleep(note_data["duration"] * 0.95)  # Slightly shorter for legato
-                
-                # Free the synth
-                sc_client.send_message("/n_free", [node_id])
+                plan.append((offset, "/s_new", [synth_name, node_id, 0, 0,
+                                                "freq", note_freqs[i],
+                                                "amp", 0.3]))
+                # Each note runs slightly short of its slot for legato
+                offset += note_durs[i] * 0.95
+                plan.append((offset, "/n_free", [node_id]))
             else:
-                # Rest - just wait
-                time.sleep(note_data["duration"])
+                # Rest - just leave a gap
+                offset += note_durs[i]
+
+    total_duration = offset
+
+    # Emission pass: hand each batch of same-offset events to scsynth as
+    # a time-tagged bundle slightly ahead of its onset, so the server's
+    # sample clock owns the fine timing
+    send_ahead = 0.2
+    wall_start = time.time() + 0.05  # Small allowance for send latency
+    mono_start = time.monotonic()
+
+    for event_offset, events in itertools.groupby(plan, key=lambda event: event[0]):
+        sleep_for = (event_offset - send_ahead) - (time.monotonic() - mono_start)
+        if sleep_for > 0:
+            await asyncio.sleep(sleep_for)
+        send_timed_bundle(wall_start + event_offset,
+                          [(address, args) for _, address, args in events])
+
+    # Wait out the tail of the sequence
+    remaining = total_duration - (time.monotonic() - mono_start)
+    if remaining > 0:
+        await asyncio.sleep(remaining)
     
     return f"Played sequence with {len(notes)} notes at {tempo} BPM, repeated {repeats} times"
 
@@ -403,9 +830,9 @@ async def create_lfo_modulation(target_param="frequency", rate=0.5, depth=0.5, w
         duration: Duration in seconds (1.0-60.0)
     """
     # Validate inputs
-    rate = max(0.01, min(10.0, float(rate)))
-    depth = max(0.0, min(1.0, float(depth)))
-    duration = max(1.0, min(60.0, float(duration)))
+    rate = _clamp(rate, 0.01, 10.0)
+    depth = _clamp(depth, 0.0, 1.0)
+    duration = _clamp(duration, 1.0, 60.0)
 
     # Map target parameter to appropriate value ranges
     param_map = {
@@ -438,63 +865,76 @@ async def create_lfo_modulation(target_param="frequency", rate=0.5, depth=0.5, w
     # Default to frequency if target not recognized
     target_info = param_map.get(target_param, param_map["frequency"])
 
+    # Precompute one LFO cycle as a lookup table so the update loop is a
+    # single array index instead of a per-step waveform branch + math.sin.
+    # The random waveform has no fixed cycle shape, so it is drawn when
+    # the trajectory is built below
+    lut_size = 1024  # Power of two so the phase index wraps with a bitmask
+    phase = np.arange(lut_size) / lut_size
+    if waveform == "triangle":
+        lut = 1.0 - np.abs(phase * 2.0 - 1.0)
+    elif waveform == "square":
+        lut = np.where(phase < 0.5, 1.0, 0.0)
+    elif waveform == "random":
+        lut = None
+    else:
+        # Sine (also the fallback for unrecognized waveforms)
+        lut = (np.sin(2.0 * np.pi * phase) + 1.0) / 2.0
+
+    min_value = target_info["min_value"]
+    value_range = target_info["max_value"] - min_value
+
+    cycle_time = 1.0 / rate  # Time for one complete cycle
+    step_time = min(0.05, cycle_time / 20.0)  # Update rate (20 steps per cycle or every 50ms)
+
+    # Compute the entire parameter trajectory up front in one vectorized
+    # pass; the send loop below then does nothing but pace OSC messages
+    num_steps = int(duration / step_time)
+    step_phases = np.arange(num_steps) * (step_time * rate * lut_size)
+    if lut is None:
+        # Random sample and hold: one fresh level per LFO cycle, held
+        # until the phase wraps into the next cycle
+        cycle_indices = step_phases.astype(np.int64) // lut_size
+        levels = np.random.random(cycle_indices[-1] + 1)
+        param_values = min_value + levels[cycle_indices] * value_range
+    else:
+        indices = step_phases.astype(np.int64) & (lut_size - 1)
+        param_values = min_value + lut[indices] * value_range
+
     # Create the main synth
     node_id = get_node_id()
     sc_client.send_message("/s_new", ["default", node_id, 0, 0,
                                       target_info["sc_param"], target_info["base_value"],
                                       "amp", 0.3])
 
-    # Start time
-    start_time = time.time()
-    end_time = start_time + duration
+    # Everything in the per-step /n_set except the value itself is fixed,
+    # so serialize the prefix once and append 4 packed bytes per send
+    nset_prefix = nset_float_template(node_id, target_info["sc_param"])
+    send = _sc_send
+
+    # Skip sends whose value is within epsilon of the last one actually
+    # sent: square waves hold each level for half a cycle and slow LFOs
+    # produce near-identical neighbors, so this sheds most of the /n_set
+    # traffic without any audible difference
+    send_epsilon = 1e-4 * value_range
+    last_sent = None
 
     # Perform the LFO modulation
     try:
-        cycle_time = 1.0 / rate  # Time for one complete cycle
-        step_time = min(0.05, cycle_time / 20.0)  # Update rate (20 steps per cycle or every 50ms)
-
-        while time.time() < end_time:
-            # Calculate elapsed time
-            elapsed = time.time() - start_time
-
-            # Calculate LFO value based on waveform
-            if waveform == "sine":
-                # Sine wave: sin(2π × rate × time) mapped to range [min, max]
-                phase = elapsed * rate * 2 * math.pi
-                lfo_value = (math.sin(phase) + 1.0) / 2.0  # 0 to 1
-            elif waveform == "triangle":
-                # Triangle wave
-                phase = (elapsed * rate) % 1.0
-                if phase < 0.5:
-                    lfo_value = phase * 2.0  # 0 to 1
-                else:
-                    lfo_value = 1.0 - (phase - 0.5) * 2.0  # 1 to 0
-            elif waveform == "square":
-                # Square wave
-                phase = (elapsed * rate) % 1.0
-                lfo_value = 1.0 if phase < 0.5 else 0.0
-            elif waveform == "random":
-                # Random sample and hold
-                phase = (elapsed * rate) % 1.0
-                # Update random value at start of each cycle
-                if phase < step_time:
-                    lfo_value = random.random()
-                else:
-                    # Hold the value for the rest of the cycle
-                    pass
-            else:
-                # Default to sine
-                phase = elapsed * rate * 2 * math.pi
-                lfo_value = (math.sin(phase) + 1.0) / 2.0
-
-            # Map LFO value to parameter range
-            param_value = target_info["min_value"] + lfo_value * (target_info["max_value"] - target_info["min_value"])
+        # Monotonic deadlines so wall-clock adjustments can't skew timing
+        next_deadline = time.monotonic()
 
-            # Update the parameter
-            sc_client.send_message("/n_set", [node_id, target_info["sc_param"], param_value])
+        for param_value in param_values:
+            # Update the parameter, unless it is effectively unchanged
+            if last_sent is None or abs(param_value - last_sent) > send_epsilon:
+                send(nset_prefix + _FLOAT_ARG.pack(param_value))
+                last_sent = param_value
 
-            # Sleep until next update
-            time.sleep(step_time)
+            # Sleep until the next absolute deadline; advancing the deadline
+            # by exactly step_time keeps the update rate from drifting, and
+            # awaiting keeps the event loop free for other MCP requests
+            next_deadline += step_time
+            await asyncio.sleep(max(0.0, next_deadline - time.monotonic()))
 
     finally:
         # Clean up
@@ -512,28 +952,31 @@ async def create_layered_synth(base_note="C3", num_layers=3, detune=0.1, effects
         base_note: Root note for the sound (e.g., "C3", "G#4")
         num_layers: Number of oscillator layers (1-5)
         detune: Amount of detuning between layers (0.0-1.0)
-        effects: Optional effects as JSON string: {"reverb": 0-1, "delay": 0-1, "distortion": 0-1}
+        effects: Optional effects as a dict (or JSON string):
+                 {"reverb": 0-1, "delay": 0-1, "distortion": 0-1}
         duration: Duration in seconds (1.0-30.0)
     """
     # Validate inputs
-    num_layers = max(1, min(5, int(num_layers)))
-    detune = max(0.0, min(1.0, float(detune)))
-    duration = max(1.0, min(30.0, float(duration)))
+    num_layers = _clamp(num_layers, 1, 5, cast=int)
+    detune = _clamp(detune, 0.0, 1.0)
+    duration = _clamp(duration, 1.0, 30.0)
 
     # Convert base note to frequency
     base_freq = note_to_freq(base_note)
 
-    # Parse effects
+    # Parse effects; typed MCP calls pass a dict directly, so the JSON
+    # parser only runs for string input
     reverb = 0.0
     delay = 0.0
     distortion = 0.0
     if effects:
         try:
-            effect_dict = json.loads(effects) if isinstance(effects, str) else effects
+            effect_dict = effects if isinstance(effects, dict) else json.loads(effects)
             if isinstance(effect_dict, dict):
-                reverb = max(0.0, min(1.0, float(effect_dict.get("reverb", 0.0))))
-                delay = max(0.0, min(1.0, float(effect_dict.get("delay", 0.0))))
-                distortion = max(0.0, min(1.0, float(effect_dict.get("distortion", 0.0))))
+                reverb, delay, distortion = (
+                    _clamp(effect_dict.get(key, 0.0), 0.0, 1.0)
+                    for key in ("reverb", "delay", "distortion")
+                )
         except (json.JSONDecodeError, ValueError, TypeError):
             pass
 
@@ -543,34 +986,17 @@ async def create_layered_synth(base_note="C3", num_layers=3, detune=0.1, effects
     # Base node ID
     base_id = get_node_id()
 
+    # Layer spreads come from the precomputed table; only the detune
+    # scaling depends on runtime input (layer 0 gets the lowest pitch)
+    offsets, layer_amps, pans = LAYER_TABLES[num_layers]
+
+    # Calculate frequencies for all layers
+    layer_freqs = base_freq * (1.0 + offsets * detune)
+
     # Create the layers
     try:
+        layer_messages = []
         for i in range(num_layers):
-            # Calculate detune factor for this layer
-            # Center detuning around the base frequency
-            detune_factor = 1.0
-            if num_layers > 1:
-                # Spread layers evenly across the detune range
-                # Layer 0 gets lowest pitch, last layer gets highest
-                detune_spread = 2.0 * detune / (num_layers - 1)
-                detune_factor = 1.0 - detune + (i * detune_spread)
-
-            # Calculate frequency for this layer
-            layer_freq = base_freq * detune_factor
-
-            # Calculate amplitude for this layer (center layer is loudest)
-            layer_amp = 0.3
-            if num_layers > 1:
-                # Center layer(s) are loudest
-                center_distance = abs(i - (num_layers - 1) / 2) / (num_layers - 1)
-                layer_amp = 0.3 * (1.0 - center_distance * 0.5)
-
-            # Calculate pan position for stereo spread
-            pan = 0.0
-            if num_layers > 1:
-                # Spread layers across the stereo field
-                pan = -0.8 + (i / (num_layers - 1)) * 1.6  # -0.8 to 0.8
-
             # Create a synth for this layer
             node_id = base_id + i
 
@@ -579,9 +1005,9 @@ async def create_layered_synth(base_note="C3", num_layers=3, detune=0.1, effects
 
             # Build parameters
             params = [
-                "freq", layer_freq,
-                "amp", layer_amp,
-                "pan", pan
+                "freq", float(layer_freqs[i]),
+                "amp", float(layer_amps[i]),
+                "pan", float(pans[i])
             ]
 
             # Add effect parameters if enabled
@@ -592,17 +1018,18 @@ async def create_layered_synth(base_note="C3", num_layers=3, detune=0.1, effects
             if distortion > 0.0:
                 params.extend(["distortion", distortion])
 
-            # Create the synth
-            sc_client.send_message("/s_new", [synth_type, node_id, 0, 0] + params)
+            layer_messages.append(("/s_new", [synth_type, node_id, 0, 0] + params))
             nodes.append(node_id)
 
+        # Create all layers at once so they start in the same datagram
+        send_bundle(layer_messages)
+
         # Wait for the specified duration
-        time.sleep(duration)
+        await asyncio.sleep(duration)
 
     finally:
-        # Clean up all nodes
-        for node_id in nodes:
-            sc_client.send_message("/n_free", [node_id])
+        # Clean up all nodes with a single /n_free
+        free_nodes(nodes)
 
     effects_str = []
     if reverb > 0.0:
@@ -629,10 +1056,10 @@ async def create_granular_texture(source_note="A4", density=0.5, grain_size=0.1,
         duration: Total duration in seconds (1.0-30.0)
     """
     # Validate inputs
-    density = max(0.1, min(1.0, float(density)))
-    grain_size = max(0.01, min(0.5, float(grain_size)))
-    pitch_spread = max(0.0, min(1.0, float(pitch_spread)))
-    duration = max(1.0, min(30.0, float(duration)))
+    density = _clamp(density, 0.1, 1.0)
+    grain_size = _clamp(grain_size, 0.01, 0.5)
+    pitch_spread = _clamp(pitch_spread, 0.0, 1.0)
+    duration = _clamp(duration, 1.0, 30.0)
 
     # Convert source note to frequency
     base_freq = note_to_freq(source_note)
@@ -648,24 +1075,43 @@ async def create_granular_texture(source_note="A4", density=0.5, grain_size=0.1,
     # Calculate time between grain onsets
     grain_interval = 1.0 / grains_per_second
 
-    # Start time
-    start_time = time.time()
+    # Start time (monotonic, so the schedule is immune to wall-clock jumps)
+    start_time = time.monotonic()
     end_time = start_time + duration
 
-    # Keep track of active nodes for cleanup
-    active_nodes = {}  # Map node_id -> expected end time
+    # Keep track of active grains as a deque of (end_time, node_id). Every
+    # grain lives exactly actual_grain_size seconds, so expiry is strictly
+    # FIFO and expired grains pop off the left end in O(1)
+    active_grains = collections.deque()
     next_node_id = get_node_id()
 
+    # Pre-generate grain randomness (pitch and pan draws) in vectorized
+    # batches instead of making several Python-level RNG calls per grain
+    rng = np.random.default_rng()
+    pool_size = 256
+    random_pool = rng.uniform(size=(pool_size, 2))
+    pool_index = 0
+
     try:
-        # Main granular synthesis loop
-        while time.time() < end_time:
+        # Main granular synthesis loop, paced by a single deadline that
+        # advances by exactly grain_interval each iteration so send and
+        # housekeeping time can't accumulate as drift
+        deadline = start_time
+
+        while deadline < end_time:
             # Create a grain
             grain_id = next_node_id
             next_node_id += 1
 
-            # Calculate random variation for this grain
+            # Draw this grain's randomness from the pool, refilling in bulk
+            if pool_index == pool_size:
+                random_pool = rng.uniform(size=(pool_size, 2))
+                pool_index = 0
+            pitch_draw, pan_draw = random_pool[pool_index]
+            pool_index += 1
+
             # Pitch variation
-            pitch_variation = 1.0 + (random.random() * 2 - 1) * pitch_spread
+            pitch_variation = 1.0 + (pitch_draw * 2 - 1) * pitch_spread
             grain_freq = base_freq * pitch_variation
 
             # Amplitude variation (quieter at edges of pitch spread)
@@ -673,32 +1119,31 @@ async def create_granular_texture(source_note="A4", density=0.5, grain_size=0.1,
             grain_amp = 0.2 * amp_factor
 
             # Pan position (stereo spread)
-            pan = random.uniform(-0.8, 0.8)
+            pan = pan_draw * 1.6 - 0.8
 
-            # Create the grain
-            sc_client.send_message("/s_new", ["default", grain_id, 0, 0,
-                                              "freq", grain_freq,
-                                              "amp", grain_amp,
-                                              "pan", pan])
+            # Create the grain from the pre-serialized /s_new template
+            dgrams = [snew_default_dgram(grain_id, grain_freq, grain_amp, pan)]
 
             # Record expected end time for this grain
-            grain_end_time = time.time() + actual_grain_size
-            active_nodes[grain_id] = grain_end_time
+            active_grains.append((deadline + actual_grain_size, grain_id))
+
+            # Clean up expired grains from the front of the deque
+            while active_grains and active_grains[0][0] <= deadline:
+                _, nid = active_grains.popleft()
+                dgrams.append(nfree_dgram(nid))
 
-            # Clean up expired grains
-            current_time = time.time()
-            expired_grains = [nid for nid, end_time in active_nodes.items() if end_time <= current_time]
-            for nid in expired_grains:
-                sc_client.send_message("/n_free", [nid])
-                del active_nodes[nid]
+            # The new grain and the expired frees share one datagram
+            send_raw_dgrams(dgrams)
 
-            # Wait until next grain
-            time.sleep(grain_interval)
+            # Wait until the next grain's absolute deadline
+            deadline += grain_interval
+            sleep_for = deadline - time.monotonic()
+            if sleep_for > 0:
+                await asyncio.sleep(sleep_for)
 
     finally:
-        # Clean up all remaining nodes
-        for node_id in active_nodes:
-            sc_client.send_message("/n_free", [node_id])
+        # Clean up all remaining nodes with a single /n_free
+        free_nodes(node_id for _, node_id in active_grains)
 
     return f"Created granular texture at {source_note} with density {density} for {duration} seconds"
 
@@ -714,233 +1159,169 @@ async def create_chord_progression(progression="C-G-Am-F", style="pad", tempo=60
         duration_per_chord: Duration per chord in beats (1.0-8.0)
     """
     # Validate inputs
-    tempo = max(40, min(180, int(tempo)))
-    duration_per_chord = max(1.0, min(8.0, float(duration_per_chord)))
+    tempo = _clamp(tempo, 40, 180, cast=int)
+    duration_per_chord = _clamp(duration_per_chord, 1.0, 8.0)
 
     # Calculate beat duration in seconds
     beat_duration = 60.0 / tempo
     chord_duration = beat_duration * duration_per_chord
 
-    # Parse the chord progression
-    chords = progression.split("-")
-    if not chords:
+    # Parse the chord progression up front (cached), so the playback loop
+    # below is pure OSC dispatch and sleeps
+    parsed_chords = _parse_progression(progression)
+    if not parsed_chords:
         return "No chord progression provided"
 
-    # Map chord names to note intervals (from root)
-    chord_types = {
-        # Major triad
-        "": [0, 4, 7],  # Root, major third, perfect fifth
-        "M": [0, 4, 7],
-        "maj": [0, 4, 7],
-
-        # Minor triad
-        "m": [0, 3, 7],  # Root, minor third, perfect fifth
-        "min": [0, 3, 7],
-
-        # Seventh chords
-        "7": [0, 4, 7, 10],  # Dominant seventh
-        "M7": [0, 4, 7, 11],  # Major seventh
-        "maj7": [0, 4, 7, 11],
-        "m7": [0, 3, 7, 10],  # Minor seventh
-        "min7": [0, 3, 7, 10],
-        "dim": [0, 3, 6],  # Diminished
-        "dim7": [0, 3, 6, 9],  # Diminished seventh
-        "aug": [0, 4, 8],  # Augmented
-
-        # Suspended chords
-        "sus2": [0, 2, 7],  # Suspended 2nd
-        "sus4": [0, 5, 7],  # Suspended 4th
-
-        # Add chords
-        "add9": [0, 4, 7, 14],  # Added 9th
-        "add11": [0, 4, 7, 17],  # Added 11th
-
-        # Power chord
-        "5": [0, 7],  # Root and fifth
-    }
-
-    # Map notes to semitones from C
-    note_to_semitone = {
-        "C": 0, "C#": 1, "Db": 1, "D": 2, "D#": 3, "Eb": 3,
-        "E": 4, "F": 5, "F#": 6, "Gb": 6, "G": 7, "G#": 8, "Ab": 8,
-        "A": 9, "A#": 10, "Bb": 10, "B": 11
-    }
-
-    # Play each chord in the progression
+    # Resolve the voicing style once; unrecognized styles fall back to pad
+    style_params = CHORD_STYLES.get(style, CHORD_STYLES["pad"])
+    amp_for = style_params["amp"]
+    pan_spread = style_params["pan_spread"]
+    hold = style_params["hold"]
+    arpeggiate = style_params["arpeggio"]
+    voiced_intervals = style_params["intervals"]
+
+    # Planning pass: lay out every onset and release for the whole
+    # progression as (offset, address, args) events, so the emission loop
+    # below is nothing but sleeps and OSC sends. Rests simply add no events.
     base_id = get_node_id()
     node_counter = 0
+    plan = []
+    offset = 0.0
 
-    for chord_idx, chord_name in enumerate(chords):
-        # Parse the chord name to extract root note and type
-        if chord_name:
-            # Find the root note
-            root_note = ""
-            chord_type = ""
-
-            # Check for flat/sharp notes first (they have 2 characters)
-            if len(chord_name) >= 2 and chord_name[0:2] in note_to_semitone:
-                root_note = chord_name[0:2]
-                chord_type = chord_name[2:]
-            else:
-                root_note = chord_name[0:1]
-                chord_type = chord_name[1:]
-
-            # Get the root note's semitone value
-            if root_note in note_to_semitone:
-                root_semitone = note_to_semitone[root_note]
-
-                # Get the intervals for this chord type
-                intervals = chord_types.get(chord_type, chord_types[""])  # Default to major if type not recognized
-
-                # Calculate frequencies for each note in the chord
-                frequencies = []
-                for interval in intervals:
-                    # Calculate semitones from C4
-                    semitones = root_semitone + interval - 9  # Adjust to be relative to A4
-                    # Convert to frequency (A4 = 440Hz)
-                    freq = 440.0 * (2.0 ** (semitones / 12.0))
-                    frequencies.append(freq)
-
-                # Play the chord according to the selected style
-                active_nodes = []
-
-                if style == "pad":
-                    # Pad style - all notes play together with slow attack
-                    for i, freq in enumerate(frequencies):
-                        node_id = base_id + node_counter
-                        node_counter += 1
-
-                        # Quieter for inner voices
-                        amp = 0.3 if i == 0 or i == len(frequencies) - 1 else 0.2
-
-                        # Small pan variation for stereo width
-                        pan = (i / (len(frequencies) - 1)) * 1.6 - 0.8 if len(frequencies) > 1 else 0.0
-
-                        sc_client.send_message("/s_new", ["default", node_id, 0, 0,
-                                                          "freq", freq,
-                                                          "amp", amp,
-                                                          "pan", pan])
-                        active_nodes.append(node_id)
-
-                    # Hold for the chord duration
-                    time.sleep(chord_duration)
-
-                    # Release all notes
-                    for node_id in active_nodes:
-                        sc_client.send_message("/n_free", [node_id])
-
-                elif style == "staccato":
-                    # Staccato style - all notes play together but shorter
-                    for i, freq in enumerate(frequencies):
-                        node_id = base_id + node_counter
-                        node_counter += 1
-
-                        # Louder for staccato
-                        amp = 0.4 if i == 0 or i == len(frequencies) - 1 else 0.3
-
-                        # Small pan variation
-                        pan = (i / (len(frequencies) - 1)) * 1.2 - 0.6 if len(frequencies) > 1 else 0.0
-
-                        sc_client.send_message("/s_new", ["default", node_id, 0, 0,
-                                                          "freq", freq,
-                                                          "amp", amp,
-                                                          "pan", pan])
-                        active_nodes.append(node_id)
-
-                    # Hold for a shorter duration (1/4 of full duration)
-                    time.sleep(chord_duration * 0.25)
-
-                    # Release all notes
-                    for node_id in active_nodes:
-                        sc_client.send_message("/n_free", [node_id])
-
-                    # Wait for the rest of the duration
-                    time.sleep(chord_duration * 0.75)
-
-                elif style == "arpeggio":
-                    # Arpeggio style - notes play in sequence
-                    note_duration = chord_duration / len(frequencies)
-
-                    for i, freq in enumerate(frequencies):
-                        node_id = base_id + node_counter
-                        node_counter += 1
-
-                        sc_client.send_message("/s_new", ["default", node_id, 0, 0,
-                                                          "freq", freq,
-                                                          "amp", 0.3])
-
-                        # Hold for slightly less than the note duration (for separation)
-                        time.sleep(note_duration * 0.9)
-
-                        # Release this note
-                        sc_client.send_message("/n_free", [node_id])
-
-                        # Small gap between notes
-                        time.sleep(note_duration * 0.1)
-
-                elif style == "power":
-                    # Power chord style - just root and fifth, louder
-                    power_intervals = [0, 7]  # Root and fifth
-
-                    for i, interval in enumerate(power_intervals):
-                        if interval in intervals:
-                            idx = intervals.index(interval)
-                            freq = frequencies[idx]
-
-                            node_id = base_id + node_counter
-                            node_counter += 1
-
-                            # Louder for power chords
-                            amp = 0.5 if i == 0 else 0.4
-
-                            sc_client.send_message("/s_new", ["default", node_id, 0, 0,
-                                                              "freq", freq,
-                                                              "amp", amp])
-                            active_nodes.append(node_id)
-
-                    # Hold for the chord duration
-                    time.sleep(chord_duration)
+    for chord_name, intervals, frequencies in parsed_chords:
+        # Unrecognized or empty chord names act as rests
+        if not frequencies:
+            offset += chord_duration
+            continue
 
-                    # Release all notes
-                    for node_id in active_nodes:
-                        sc_client.send_message("/n_free", [node_id])
+        # Restrict the voicing to a subset of intervals when the style
+        # asks for it (power chords play only the root and fifth)
+        if voiced_intervals is not None:
+            frequencies = tuple(freq for interval, freq in zip(intervals, frequencies)
+                                if interval in voiced_intervals)
+            if not frequencies:
+                offset += chord_duration
+                continue
 
-                else:
-                    # Default to pad style if not recognized
-                    # Same as pad implementation
-                    for i, freq in enumerate(frequencies):
-                        node_id = base_id + node_counter
-                        node_counter += 1
+        note_count = len(frequencies)
 
-                        amp = 0.3 if i == 0 or i == len(frequencies) - 1 else 0.2
-                        pan = (i / (len(frequencies) - 1)) * 1.6 - 0.8 if len(frequencies) > 1 else 0.0
+        if arpeggiate:
+            # Notes play in sequence within the chord
+            note_duration = chord_duration / note_count
 
-                        sc_client.send_message("/s_new", ["default", node_id, 0, 0,
-                                                          "freq", freq,
-                                                          "amp", amp,
-                                                          "pan", pan])
-                        active_nodes.append(node_id)
+            for i, freq in enumerate(frequencies):
+                node_id = base_id + node_counter
+                node_counter += 1
 
-                    # Hold for the chord duration
-                    time.sleep(chord_duration)
+                onset = offset + i * note_duration
+                plan.append((onset, "/s_new", ["default", node_id, 0, 0,
+                                               "freq", freq,
+                                               "amp", amp_for(i, note_count)]))
 
-                    # Release all notes
-                    for node_id in active_nodes:
-                        sc_client.send_message("/n_free", [node_id])
-            else:
-                # If chord name not recognized, just pause for the duration
-                time.sleep(chord_duration)
+                # Release slightly before the next onset (for separation)
+                plan.append((onset + note_duration * hold, "/n_free", [node_id]))
         else:
-            # Empty chord name, just pause
-            time.sleep(chord_duration)
+            # All notes start together and release together
+            chord_nodes = []
+
+            for i, freq in enumerate(frequencies):
+                node_id = base_id + node_counter
+                node_counter += 1
+
+                params = ["default", node_id, 0, 0,
+                          "freq", freq,
+                          "amp", amp_for(i, note_count)]
+
+                # Small pan variation for stereo width
+                if pan_spread > 0.0:
+                    pan = (i / (note_count - 1)) * pan_spread - pan_spread / 2 if note_count > 1 else 0.0
+                    params.extend(["pan", pan])
+
+                plan.append((offset, "/s_new", params))
+                chord_nodes.append(node_id)
+
+            # One variadic /n_free releases the whole chord
+            plan.append((offset + chord_duration * hold, "/n_free", chord_nodes))
+
+        offset += chord_duration
+
+    total_duration = offset
+    plan.sort(key=lambda event: event[0])
+
+    # Emission pass: walk the sorted plan, dispatching each batch of
+    # same-offset events as one time-tagged bundle slightly ahead of its
+    # onset. scsynth handles the precise timing; Python only has to wake
+    # up in the right neighborhood.
+    send_ahead = 0.2  # How far ahead of onset to hand events to scsynth
+    wall_start = time.time() + 0.05  # Small allowance for send latency
+    mono_start = time.monotonic()
+
+    for event_offset, events in itertools.groupby(plan, key=lambda event: event[0]):
+        wake_at = event_offset - send_ahead
+        sleep_for = wake_at - (time.monotonic() - mono_start)
+        if sleep_for > 0:
+            await asyncio.sleep(sleep_for)
+        send_timed_bundle(wall_start + event_offset,
+                          [(address, args) for _, address, args in events])
+
+    # Wait out the tail of the progression
+    remaining = total_duration - (time.monotonic() - mono_start)
+    if remaining > 0:
+        await asyncio.sleep(remaining)
+
+    return f"Played {len(parsed_chords)}-chord progression in {style} style at {tempo} BPM"
+
+# Frequency spans for the ambient tool's pitch ranges
+PITCH_RANGES = {
+    "low": (50, 200),
+    "medium": (200, 800),
+    "high": (800, 3200),
+    "full": (50, 3200)
+}
 
-    return f"Played {len(chords)}-chord progression in {style} style at {tempo} BPM"
+# Mood characteristics for the ambient tool. The base frequency is a
+# range here; the tool samples it per call for the chosen mood only
+AMBIENT_MOODS = {
+    "calm": {
+        "base_freq_range": (100, 200),
+        "amplitude": 0.3,
+        "harmonics": (1.0, 2.0, 3.0),  # Consonant harmonics
+        "event_duration": (2.0, 8.0)
+    },
+    "dark": {
+        "base_freq_range": (60, 150),
+        "amplitude": 0.4,
+        "harmonics": (1.0, 1.5, 2.5, 3.5),  # More dissonant harmonics
+        "event_duration": (3.0, 10.0)
+    },
+    "bright": {
+        "base_freq_range": (200, 400),
+        "amplitude": 0.25,
+        "harmonics": (1.0, 2.0, 4.0, 8.0),  # Higher harmonics
+        "event_duration": (1.0, 5.0)
+    },
+    "mysterious": {
+        "base_freq_range": (80, 300),
+        "amplitude": 0.35,
+        "harmonics": (1.0, 1.7, 2.3, 3.3),  # Unusual harmonic ratios
+        "event_duration": (4.0, 12.0)
+    },
+    "chaotic": {
+        "base_freq_range": (100, 500),
+        "amplitude": 0.5,
+        "harmonics": (1.0, 1.3, 2.1, 2.7, 3.4),  # Complex, less consonant harmonics
+        "event_duration": (0.5, 4.0)
+    }
+}
 
 @mcp.tool()
 async def create_ambient_soundscape(duration=30, density=0.5, pitch_range="medium", mood="calm"):
     """
     Create an ambient soundscape with various textures and layers.
 
+    The soundscape plays in the background: the call returns a run id
+    right away, and stop_performance() can end the run early.
+
     Args:
         duration: Length of the soundscape in seconds (10-120)
         density: Density of sound events (0.0-1.0)
@@ -948,62 +1329,35 @@ async def create_ambient_soundscape(duration=30, density=0.5, pitch_range="mediu
         mood: Emotional quality ("calm", "dark", "bright", "mysterious", "chaotic")
     """
     # Validate and process inputs
-    duration = max(10, min(120, int(duration)))
-    density = max(0.0, min(1.0, float(density)))
-
-    # Map pitch range to frequency ranges
-    pitch_ranges = {
-        "low": (50, 200),
-        "medium": (200, 800),
-        "high": (800, 3200),
-        "full": (50, 3200)
-    }
-    freq_range = pitch_ranges.get(pitch_range, pitch_ranges["medium"])
-
-    # Map mood to audio characteristics
-    moods = {
-        "calm": {
-            "base_freq": random.uniform(100, 200),
-            "amplitude": 0.3,
-            "harmonics": [1.0, 2.0, 3.0],  # Consonant harmonics
-            "event_duration": (2.0, 8.0)
-        },
-        "dark": {
-            "base_freq": random.uniform(60, 150),
-            "amplitude": 0.4,
-            "harmonics": [1.0, 1.5, 2.5, 3.5],  # More dissonant harmonics
-            "event_duration": (3.0, 10.0)
-        },
-        "bright": {
-            "base_freq": random.uniform(200, 400),
-            "amplitude": 0.25,
-            "harmonics": [1.0, 2.0, 4.0, 8.0],  # Higher harmonics
-            "event_duration": (1.0, 5.0)
-        },
-        "mysterious": {
-            "base_freq": random.uniform(80, 300),
-            "amplitude": 0.35,
-            "harmonics": [1.0, 1.7, 2.3, 3.3],  # Unusual harmonic ratios
-            "event_duration": (4.0, 12.0)
-        },
-        "chaotic": {
-            "base_freq": random.uniform(100, 500),
-            "amplitude": 0.5,
-            "harmonics": [1.0, 1.3, 2.1, 2.7, 3.4],  # Complex, less consonant harmonics
-            "event_duration": (0.5, 4.0)
-        }
-    }
-
-    # Default to "calm" if mood not recognized
-    mood_params = moods.get(mood, moods["calm"])
+    duration = _clamp(duration, 10, 120, cast=int)
+    density = _clamp(density, 0.0, 1.0)
 
     # Calculate number of events based on density
     # Higher density = more overlapping sounds
     num_events = int(duration * density * 0.5)
-    num_events = max(3, min(20, num_events))  # Reasonable limits
+    num_events = _clamp(num_events, 3, 20, cast=int)  # Reasonable limits
+
+    run_id = _start_performance(
+        "soundscape", _run_soundscape(duration, num_events, pitch_range, mood))
 
-    # Track active nodes for cleanup
-    active_nodes = []
+    return (f"Started a {mood} ambient soundscape lasting {duration} seconds "
+            f"with {num_events} sound events (run id: {run_id})")
+
+async def _run_soundscape(duration, num_events, pitch_range, mood):
+    """Play one ambient soundscape; runs as a background task."""
+    freq_range = PITCH_RANGES.get(pitch_range, PITCH_RANGES["medium"])
+
+    # One local generator for every draw the tool makes
+    rng = np.random.default_rng()
+
+    # Default to "calm" if mood not recognized; the base frequency is
+    # drawn only for the mood actually chosen
+    mood_params = AMBIENT_MOODS.get(mood, AMBIENT_MOODS["calm"])
+    base_freq = rng.uniform(*mood_params["base_freq_range"])
+
+    # Track active nodes for cleanup; a set, so dropping an id when
+    # its planned /n_free goes out is O(1)
+    active_nodes = set()
 
     # Base node ID
     base_id = get_node_id()
@@ -1011,96 +1365,140 @@ async def create_ambient_soundscape(duration=30, density=0.5, pitch_range="mediu
     # Create background drone
     bg_id = base_id
     sc_client.send_message("/s_new", ["default", bg_id, 0, 0,
-                                      "freq", mood_params["base_freq"],
+                                      "freq", base_freq,
                                       "amp", mood_params["amplitude"] * 0.5])
-    active_nodes.append(bg_id)
+    active_nodes.add(bg_id)
+
+    # Planning pass: draw every event, its modulation ticks and its free
+    # up front, so the events can overlap instead of queuing behind each
+    # other's inline waits
+    plan = []
+
+    # Per-event draws, each taken as one batch; the derived columns
+    # (clipped frequencies, scaled amplitudes, capped durations) are
+    # computed across all events at once
+    event_starts = np.sort(rng.uniform(0, duration * 0.8, num_events))  # Within first 80%
+    event_freqs = np.clip(base_freq * rng.choice(mood_params["harmonics"], num_events),
+                          freq_range[0], freq_range[1])
+    event_amps = mood_params["amplitude"] * rng.uniform(0.5, 1.0, num_events)
+    min_dur, max_dur = mood_params["event_duration"]
+    event_durs = np.minimum(rng.uniform(min_dur, max_dur, num_events),
+                            duration - event_starts)
+    mod_rolls = rng.random(num_events)
+    free_rolls = rng.random(num_events)
+
+    for i in range(num_events):
+        event_start = event_starts[i]
+        event_freq = event_freqs[i]
+        event_amp = event_amps[i]
+        event_dur = event_durs[i]
+
+        if event_dur <= 0:
+            continue  # Skip if no time left
+
+        event_id = base_id + 100 + i
+        plan.append((event_start, "/s_new", ["default", event_id, 0, 0,
+                                             "freq", event_freq,
+                                             "amp", event_amp]))
+        active_nodes.add(event_id)
+
+        # For longer events, add some LFO-like modulation: small random
+        # frequency shifts every 0.5 seconds. Shifts that land within
+        # 0.5% of the frequency the node already has are inaudible, so
+        # those ticks are dropped rather than sent
+        if event_dur > 3.0 and mod_rolls[i] < 0.7:
+            sent_freq = event_freq
+            mod_freqs = event_freq * rng.uniform(0.98, 1.02, int(event_dur / 0.5))
+            for j, mod_freq in enumerate(mod_freqs):
+                if abs(mod_freq - sent_freq) / sent_freq < 0.005:
+                    continue
+                plan.append((event_start + 0.5 * j, "/n_set", [event_id, "freq", mod_freq]))
+                sent_freq = mod_freq
+
+        # Free the node at the event's end unless it's a long event that
+        # should carry into the final cleanup
+        if event_dur < 5.0 or free_rolls[i] < 0.7:
+            plan.append((event_start + event_dur, "/n_free", [event_id]))
+
+    plan.sort(key=lambda event: event[0])
+
+    # Emission pass: events are grouped into 50ms windows, so overlapping
+    # sounds and their modulations share one bundle (and one sendto())
+    # per window instead of leaving as individual messages
+    window = 0.05
+    send_ahead = 0.2
+    wall_start = time.time() + 0.05  # Small allowance for send latency
+    mono_start = time.monotonic()
 
-    # Start time
-    start_time = time.time()
-    end_time = start_time + duration
-
-    # Generate sound events
     try:
-        for i in range(num_events):
-            # Calculate when this event should start
-            event_start = random.uniform(0, duration * 0.8)  # Start within first 80% of total duration
-            time_to_wait = start_time + event_start - time.time()
-
-            if time_to_wait > 0:
-                time.sleep(time_to_wait)
-
-            # Check if we've exceeded our duration
-            if time.time() >= end_time:
-                break
-
-            # Choose a harmonic ratio from the mood's harmonics
-            harmonic = random.choice(mood_params["harmonics"])
-
-            # Calculate frequency for this event
-            event_freq = mood_params["base_freq"] * harmonic
-
-            # Ensure frequency is within the desired pitch range
-            event_freq = max(freq_range[0], min(freq_range[1], event_freq))
-
-            # Randomize amplitude slightly
-            event_amp = mood_params["amplitude"] * random.uniform(0.5, 1.0)
-
-            # Determine duration for this event
-            min_dur, max_dur = mood_params["event_duration"]
-            event_dur = random.uniform(min_dur, max_dur)
-
-            # Ensure event doesn't exceed total duration
-            remaining_time = end_time - time.time()
-            event_dur = min(event_dur, remaining_time)
-
-            if event_dur <= 0:
-                continue  # Skip if no time left
-
-            # Create the event sound
-            event_id = base_id + 100 + i
-            sc_client.send_message("/s_new", ["default", event_id, 0, 0,
-                                              "freq", event_freq,
-                                              "amp", event_amp])
-            active_nodes.append(event_id)
-
-            # For longer events, add some modulation
-            if event_dur > 3.0 and random.random() < 0.7:
-                # Random LFO-like frequency modulation
-                for j in range(int(event_dur / 0.5)):  # Every 0.5 seconds
-                    if time.time() >= end_time:
-                        break
-
-                    # Small random frequency shifts
-                    mod_freq = event_freq * random.uniform(0.98, 1.02)
-                    sc_client.send_message("/n_set", [event_id, "freq", mod_freq])
-
-                    time.sleep(0.5)
-            else:
-                # For shorter events, just wait the duration
-                time.sleep(event_dur)
-
-            # Free this event's node unless it's a long event that should continue
-            if event_dur < 5.0 or random.random() < 0.7:
-                sc_client.send_message("/n_free", [event_id])
-                active_nodes.remove(event_id)
+        for window_index, events in itertools.groupby(plan, key=lambda event: int(event[0] / window)):
+            event_offset = window_index * window
+            sleep_for = (event_offset - send_ahead) - (time.monotonic() - mono_start)
+            if sleep_for > 0:
+                await asyncio.sleep(sleep_for)
+            events = list(events)
+            send_timed_bundle(wall_start + event_offset,
+                              [(address, args) for _, address, args in events])
+            for _, address, args in events:
+                if address == "/n_free":
+                    active_nodes.discard(args[0])
 
         # Wait until the full duration has passed
-        remaining = end_time - time.time()
+        remaining = duration - (time.monotonic() - mono_start)
         if remaining > 0:
-            time.sleep(remaining)
+            await asyncio.sleep(remaining)
 
     finally:
-        # Clean up all active nodes
-        for node in active_nodes:
-            sc_client.send_message("/n_free", [node])
-
-    return f"Created a {mood} ambient soundscape lasting {duration} seconds with {num_events} sound events"
+        # Clean up any remaining nodes with a single /n_free
+        free_nodes(active_nodes)
+
+# Rhythm characteristics per style for the generative rhythm tool
+RHYTHM_STYLES = {
+    "minimal": {
+        "pulse_rate": 0.8,         # How often pulses occur (0-1)
+        "variation_rate": 0.2,     # How often the pattern changes (0-1)
+        "complexity": 0.3,         # Rhythmic complexity (0-1)
+        "syncopation": 0.2,        # Off-beat emphasis (0-1)
+        "swing": 0.1               # Timing swing factor (0-1)
+    },
+    "techno": {
+        "pulse_rate": 0.9,
+        "variation_rate": 0.3,
+        "complexity": 0.5,
+        "syncopation": 0.4,
+        "swing": 0.2
+    },
+    "glitch": {
+        "pulse_rate": 0.7,
+        "variation_rate": 0.8,
+        "complexity": 0.9,
+        "syncopation": 0.7,
+        "swing": 0.3
+    },
+    "jazz": {
+        "pulse_rate": 0.6,
+        "variation_rate": 0.5,
+        "complexity": 0.7,
+        "syncopation": 0.8,
+        "swing": 0.7
+    },
+    "ambient": {
+        "pulse_rate": 0.4,
+        "variation_rate": 0.2,
+        "complexity": 0.2,
+        "syncopation": 0.1,
+        "swing": 0.05
+    }
+}
 
 @mcp.tool()
 async def create_generative_rhythm(style="minimal", duration=20, tempo=120, intensity=0.5):
     """
     Create a generative rhythm that evolves over time.
 
+    The rhythm plays in the background: the call returns a run id right
+    away, and stop_performance() can end the run early.
+
     Args:
         style: Rhythm style ("minimal", "techno", "glitch", "jazz", "ambient")
         duration: Length of the rhythm in seconds (5-120)
@@ -1108,164 +1506,200 @@ async def create_generative_rhythm(style="minimal", duration=20, tempo=120, inte
         intensity: Overall intensity/complexity (0.0-1.0)
     """
     # Validate inputs
-    duration = max(5, min(120, int(duration)))
-    tempo = max(60, min(240, int(tempo)))
-    intensity = max(0.0, min(1.0, float(intensity)))
+    duration = _clamp(duration, 5, 120, cast=int)
+    tempo = _clamp(tempo, 60, 240, cast=int)
+    intensity = _clamp(intensity, 0.0, 1.0)
+
+    run_id = _start_performance("rhythm", _run_rhythm(style, duration, tempo, intensity))
 
+    return (f"Started a generative {style} rhythm at {tempo} BPM for {duration} seconds "
+            f"with intensity {intensity} (run id: {run_id})")
+
+async def _run_rhythm(style, duration, tempo, intensity):
+    """Play one generative rhythm; runs as a background task."""
     # Calculate beat duration in seconds
     beat_duration = 60 / tempo
 
-    # Map styles to rhythm characteristics
-    styles = {
-        "minimal": {
-            "pulse_rate": 0.8,         # How often pulses occur (0-1)
-            "variation_rate": 0.2,     # How often the pattern changes (0-1)
-            "complexity": 0.3,         # Rhythmic complexity (0-1)
-            "syncopation": 0.2,        # Off-beat emphasis (0-1)
-            "swing": 0.1               # Timing swing factor (0-1)
-        },
-        "techno": {
-            "pulse_rate": 0.9,
-            "variation_rate": 0.3,
-            "complexity": 0.5,
-            "syncopation": 0.4,
-            "swing": 0.2
-        },
-        "glitch": {
-            "pulse_rate": 0.7,
-            "variation_rate": 0.8,
-            "complexity": 0.9,
-            "syncopation": 0.7,
-            "swing": 0.3
-        },
-        "jazz": {
-            "pulse_rate": 0.6,
-            "variation_rate": 0.5,
-            "complexity": 0.7,
-            "syncopation": 0.8,
-            "swing": 0.7
-        },
-        "ambient": {
-            "pulse_rate": 0.4,
-            "variation_rate": 0.2,
-            "complexity": 0.2,
-            "syncopation": 0.1,
-            "swing": 0.05
-        }
-    }
-
     # Default to "minimal" if style not recognized
-    style_params = styles.get(style, styles["minimal"])
-
-    # Adjust parameters based on intensity
-    for param in style_params:
-        # Intensity scales the parameter up or down from its base value
-        # Higher intensity = more of everything
-        style_params[param] *= (0.7 + intensity * 0.6)  # Scale between 70% and 130%
-        style_params[param] = min(1.0, style_params[param])  # Cap at 1.0
+    style_params = RHYTHM_STYLES.get(style, RHYTHM_STYLES["minimal"])
+
+    # Intensity scales each parameter between 70% and 130% of its base
+    # value, capped at 1.0. Higher intensity = more of everything. The
+    # scaled values go into locals instead of back into the style table
+    intensity_scale = 0.7 + intensity * 0.6
+    pulse_rate = min(1.0, style_params["pulse_rate"] * intensity_scale)
+    variation_rate = min(1.0, style_params["variation_rate"] * intensity_scale)
+    complexity = min(1.0, style_params["complexity"] * intensity_scale)
+    syncopation = min(1.0, style_params["syncopation"] * intensity_scale)
+    swing = min(1.0, style_params["swing"] * intensity_scale)
 
     # Calculate number of beats
     num_beats = int(duration / beat_duration)
-    num_beats = max(4, min(240, num_beats))  # Reasonable limits
+    num_beats = _clamp(num_beats, 4, 240, cast=int)  # Reasonable limits
 
     # Base patterns (16-step)
     # Initialize with some basic patterns based on style
+    rng = np.random.default_rng()
     if style == "minimal":
-        kick_pattern = [1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0]  # Four on the floor
-        snare_pattern = [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0]  # Backbeat
-        hihat_pattern = [1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0]  # Eighth notes
+        kick_pattern = np.array([1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0], dtype=np.uint8)  # Four on the floor
+        snare_pattern = np.array([0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0], dtype=np.uint8)  # Backbeat
+        hihat_pattern = np.array([1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0], dtype=np.uint8)  # Eighth notes
     elif style == "techno":
-        kick_pattern = [1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0]
-        snare_pattern = [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0]
-        hihat_pattern = [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]  # 16th notes
+        kick_pattern = np.array([1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0], dtype=np.uint8)
+        snare_pattern = np.array([0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0], dtype=np.uint8)
+        hihat_pattern = np.ones(16, dtype=np.uint8)  # 16th notes
     elif style == "glitch":
         # Random patterns for glitch
-        kick_pattern = [random.randint(0, 1) for _ in range(16)]
-        snare_pattern = [random.randint(0, 1) for _ in range(16)]
-        hihat_pattern = [random.randint(0, 1) for _ in range(16)]
+        kick_pattern, snare_pattern, hihat_pattern = rng.integers(0, 2, size=(3, 16), dtype=np.uint8)
     elif style == "jazz":
         # Jazz-influenced pattern
-        kick_pattern = [1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 0]
-        snare_pattern = [0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0]
-        hihat_pattern = [1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0]
+        kick_pattern = np.array([1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 0], dtype=np.uint8)
+        snare_pattern = np.array([0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0], dtype=np.uint8)
+        hihat_pattern = np.array([1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0], dtype=np.uint8)
     else:  # ambient or default
         # Sparse pattern
-        kick_pattern = [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0]
-        snare_pattern = [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-        hihat_pattern = [0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0]
+        kick_pattern = np.array([1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0], dtype=np.uint8)
+        snare_pattern = np.array([0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], dtype=np.uint8)
+        hihat_pattern = np.array([0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0], dtype=np.uint8)
+
+    # Draw every probabilistic decision for the whole run up front, so
+    # the beat loop only reads precomputed booleans: per-beat pulse and
+    # accent gates, accent pitches, per-cycle evolution gates and bit
+    # flips, and the swing offset for every beat
+    num_cycles = (num_beats + 15) // 16
+    evolve_gate = rng.random(num_cycles) < variation_rate
+    kick_flips = rng.random((num_cycles, 16)) < complexity * 0.5
+    snare_flips = rng.random((num_cycles, 16)) < complexity * 0.3
+    hihat_flips = rng.random((num_cycles, 16)) < complexity * 0.7
+    pulse_gates = rng.random((num_beats, 3)) < pulse_rate
+    accent_gates = rng.random(num_beats) < syncopation * 0.2
+    accent_freqs = rng.choice([800, 1600, 2400], size=num_beats)
+    swing_offsets = np.where(np.arange(num_beats) % 16 % 2 == 1,
+                             beat_duration * swing * 0.5, 0.0)
 
     # Base node ID
     base_id = get_node_id()
 
-    # Play the generative rhythm
+    # All beat synths live in one group, freed wholesale at the end as a
+    # backstop for anything a per-beat free misses
+    group_id = base_id + 5000
+    sc_client.send_message("/g_new", [group_id, 0, 0])
+
+    # Pre-serialize each voice's /s_new (only the node id varies between
+    # hits), including one template per accent pitch
+    kick_template = snew_freq_amp_template(60, 0.5, group_id)
+    snare_template = snew_freq_amp_template(300, 0.3, group_id)
+    hihat_template = snew_freq_amp_template(1200, 0.2, group_id)
+    accent_templates = {
+        freq: snew_freq_amp_template(freq, 0.15, group_id) for freq in (800, 1600, 2400)
+    }
+
+    # Beat timeline: swing stretches the odd steps, so onsets come from a
+    # running sum of the per-beat lengths
+    beat_lengths = beat_duration + swing_offsets
+    beat_ends = np.cumsum(beat_lengths)
+    beat_onsets = beat_ends - beat_lengths
+    total_duration = beat_ends[-1]
+
+    # Schedule the rhythm one 16-beat cycle at a time: every trigger and
+    # free for the cycle leaves as a single datagram of time-tagged
+    # bundles just ahead of the cycle's start, and scsynth keeps the
+    # per-beat timing
+    send_ahead = 0.2
+    wall_start = time.time() + 0.05  # Small allowance for send latency
+    mono_start = time.monotonic()
+
     try:
-        for beat in range(num_beats):
-            # Every 8 or 16 beats, potentially evolve the pattern based on variation_rate
-            if (beat % 16 == 0) and (random.random() < style_params["variation_rate"]):
-                # Evolve kick pattern
-                for i in range(16):
-                    if random.random() < style_params["complexity"] * 0.5:
-                        # Flip a bit
-                        kick_pattern[i] = 1 - kick_pattern[i]
-
-                # Evolve snare pattern
-                for i in range(16):
-                    if random.random() < style_params["complexity"] * 0.3:
-                        # Flip a bit
-                        snare_pattern[i] = 1 - snare_pattern[i]
-
-                # Evolve hihat pattern
-                for i in range(16):
-                    if random.random() < style_params["complexity"] * 0.7:
-                        # Flip a bit
-                        hihat_pattern[i] = 1 - hihat_pattern[i]
-
-            # Current position in the 16-step pattern
-            step = beat % 16
-
-            # Add swing
-            swing_amount = 0
-            if step % 2 == 1:  # Only apply swing to off-beats
-                swing_amount = beat_duration * style_params["swing"] * 0.5
-
-            # Play drum sounds based on patterns
-            # Add randomization based on complexity
-            if kick_pattern[step] == 1 and (random.random() < style_params["pulse_rate"]):
-                kick_id = base_id + beat
-                sc_client.send_message("/s_new", ["default", kick_id, 0, 0, "freq", 60, "amp", 0.5])
-
-            if snare_pattern[step] == 1 and (random.random() < style_params["pulse_rate"]):
-                snare_id = base_id + 1000 + beat
-                sc_client.send_message("/s_new", ["default", snare_id, 0, 0, "freq", 300, "amp", 0.3])
-
-            if hihat_pattern[step] == 1 and (random.random() < style_params["pulse_rate"]):
-                hihat_id = base_id + 2000 + beat
-                sc_client.send_message("/s_new", ["default", hihat_id, 0, 0, "freq", 1200, "amp", 0.2])
-
-            # Add occasional random accents based on syncopation
-            if random.random() < style_params["syncopation"] * 0.2:
-                accent_id = base_id + 3000 + beat
-                sc_client.send_message("/s_new", ["default", accent_id, 0, 0,
-                                                  "freq", random.choice([800, 1600, 2400]),
-                                                  "amp", 0.15])
-
-            # Wait for this beat (including swing)
-            time.sleep(beat_duration + swing_amount)
-
-            # Free all sounds from this beat
-            potential_ids = [
-                base_id + beat,          # Kick
-                base_id + 1000 + beat,   # Snare
-                base_id + 2000 + beat,   # Hihat
-                base_id + 3000 + beat    # Accent
-            ]
-            for node_id in potential_ids:
-                sc_client.send_message("/n_free", [node_id])
+        for cycle in range(num_cycles):
+            # Potentially evolve the patterns by applying this cycle's
+            # precomputed bit flips
+            if evolve_gate[cycle]:
+                kick_pattern = kick_pattern ^ kick_flips[cycle]
+                snare_pattern = snare_pattern ^ snare_flips[cycle]
+                hihat_pattern = hihat_pattern ^ hihat_flips[cycle]
+
+            groups = []
+            for beat in range(cycle * 16, min(cycle * 16 + 16, num_beats)):
+                # Current position in the 16-step pattern
+                step = beat % 16
+
+                # Collect the beat's voices so they trigger together
+                fired = []
+                dgrams = []
+                if kick_pattern[step] and pulse_gates[beat, 0]:
+                    fired.append(base_id + beat)
+                    dgrams.append(fill_node_id(kick_template, fired[-1]))
+
+                if snare_pattern[step] and pulse_gates[beat, 1]:
+                    fired.append(base_id + 1000 + beat)
+                    dgrams.append(fill_node_id(snare_template, fired[-1]))
+
+                if hihat_pattern[step] and pulse_gates[beat, 2]:
+                    fired.append(base_id + 2000 + beat)
+                    dgrams.append(fill_node_id(hihat_template, fired[-1]))
+
+                # Add occasional random accents based on syncopation
+                if accent_gates[beat]:
+                    fired.append(base_id + 3000 + beat)
+                    dgrams.append(fill_node_id(accent_templates[int(accent_freqs[beat])], fired[-1]))
+
+                if fired:
+                    groups.append((wall_start + beat_onsets[beat], dgrams))
+                    groups.append((wall_start + beat_ends[beat],
+                                   [nfree_dgram(node_id) for node_id in fired]))
+
+            # Hand the cycle to scsynth a little ahead of its first beat
+            sleep_for = (beat_onsets[cycle * 16] - send_ahead) - (time.monotonic() - mono_start)
+            if sleep_for > 0:
+                await asyncio.sleep(sleep_for)
+            send_raw_timed_dgrams(groups)
+
+        # Wait out the performance
+        remaining = total_duration - (time.monotonic() - mono_start)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+    finally:
+        # Tear down the group and anything still sounding inside it
+        send_bundle([("/g_freeAll", [group_id]), ("/n_free", [group_id])])
 
-    except Exception as e:
-        return f"Error in generative rhythm: {str(e)}"
+@mcp.tool()
+async def stop_performance(run_id=""):
+    """
+    Stop a background performance and free its nodes.
 
-    return f"Created a generative {style} rhythm at {tempo} BPM for {duration} seconds with intensity {intensity}"
+    Args:
+        run_id: The run id returned when the performance started.
+                Empty stops every active performance.
+    """
+    if run_id:
+        task = _active_performances.get(run_id)
+        if task is None:
+            if _active_performances:
+                active = ", ".join(sorted(_active_performances))
+                return f"No performance with run id {run_id} (active: {active})"
+            return f"No performance with run id {run_id} (nothing is playing)"
+        stopping = {run_id: task}
+    else:
+        stopping = dict(_active_performances)
+        if not stopping:
+            return "Nothing is playing"
+
+    for task in stopping.values():
+        task.cancel()
+
+    # Wait the cancellations out so each run's cleanup (node frees, group
+    # teardown) has gone to scsynth before reporting
+    await asyncio.gather(*stopping.values(), return_exceptions=True)
+
+    return f"Stopped {', '.join(sorted(stopping))}"
+
+# Warm the tool schemas once at import. FastMCP builds each tool's
+# Pydantic argument model at decoration time, but the JSON schema is
+# materialized lazily; touching it here moves that cost out of the first
+# tools/list and tools/call requests.
+for _tool in mcp._tool_manager.list_tools():
+    _tool.fn_metadata.arg_model.model_json_schema()
 
 if __name__ == "__main__":
     print("SuperCollider OSC MCP Server running")
@@ -1285,7 +1719,8 @@ if __name__ == "__main__":
     print("9. create_chord_progression - Play a chord progression with selectable voicing style")
 
     print("\n=== Soundscape Generation ===")
-    print("10. create_ambient_soundscape - Create an ambient soundscape with textures and layers")
-    print("11. create_generative_rhythm - Create a generative rhythm that evolves over time")
+    print("10. create_ambient_soundscape - Start an ambient soundscape playing in the background")
+    print("11. create_generative_rhythm - Start an evolving generative rhythm in the background")
+    print("12. stop_performance - Stop a background performance by run id (or all of them)")
 
     print("\nTo test locally, run: python -m mcp.run server.py")
\ No newline at end of file
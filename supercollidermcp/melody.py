@@ -6,7 +6,7 @@ This module provides functions for generating and playing melodies through Super
 
 import random
 import time
-from .osc import SuperColliderClient
+from .osc import SuperColliderClient, get_client
 
 # Define scale patterns (semitones from root)
 SCALES = {
@@ -67,9 +67,9 @@ def play_melody(melody, tempo=120, client=None):
     Returns:
         bool: True if successful.
     """
-    # Create client if needed
+    # Use the shared client if none was given
     if client is None:
-        client = SuperColliderClient()
+        client = get_client()
     
     # Calculate beat duration
     beat_duration = 60 / tempo
@@ -107,9 +107,9 @@ def play_scale(scale="major", tempo=120, direction="both", client=None):
     if scale not in SCALES:
         scale = "major"
     
-    # Create client if needed
+    # Use the shared client if none was given
     if client is None:
-        client = SuperColliderClient()
+        client = get_client()
     
     # Calculate beat duration
     beat_duration = 60 / tempo
@@ -4,6 +4,7 @@ OSC communication module for SuperCollider.
 This module provides classes and functions for sending OSC messages to SuperCollider.
 """
 
+import socket
 import time
 from pythonosc import udp_client
 
@@ -25,6 +26,10 @@ class SuperColliderClient:
         self.ip = ip
         self.port = port
         self.client = udp_client.SimpleUDPClient(ip, port)
+        # Enlarge the UDP send buffer so bursts of small OSC packets
+        # don't block on the default buffer (the OS may cap the size;
+        # on Linux, raise net.core.wmem_max to go higher)
+        self.client._sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
     
     def send_message(self, address, args):
         """
@@ -112,8 +117,26 @@ class SuperColliderClient:
             
         return node_id
 
+# Pool of clients keyed by (ip, port), so repeated tool calls reuse one
+# socket per destination instead of opening a fresh one each time
+_CLIENT_POOL = {}
+
+def get_client(ip=DEFAULT_SC_IP, port=DEFAULT_SC_PORT):
+    """
+    Return a shared SuperColliderClient for the given destination.
+    
+    Args:
+        ip (str): The IP address of the SuperCollider server.
+        port (int): The port of the SuperCollider server.
+    """
+    key = (ip, port)
+    client = _CLIENT_POOL.get(key)
+    if client is None:
+        client = _CLIENT_POOL[key] = SuperColliderClient(ip, port)
+    return client
+
 # Create a default client for convenience
-default_client = SuperColliderClient()
+default_client = get_client()
 
 # Export functions that use the default client
 def send_message(address, args):
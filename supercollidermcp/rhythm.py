@@ -6,7 +6,7 @@ This module provides functions for generating and playing rhythmic patterns thro
 
 import random
 import time
-from .osc import SuperColliderClient
+from .osc import SuperColliderClient, get_client
 
 # Predefined drum patterns (1 = hit, 0 = rest)
 PATTERNS = {
@@ -70,9 +70,9 @@ def play_drum_pattern(pattern_type="four_on_floor", beats=16, tempo=120, client=
     beats = max(4, min(32, int(beats)))  # Clamp between 4-32 beats
     tempo = max(60, min(240, int(tempo)))  # Clamp between 60-240 BPM
     
-    # Create client if needed
+    # Use the shared client if none was given
     if client is None:
-        client = SuperColliderClient()
+        client = get_client()
     
     # Select or generate pattern
     if pattern_type == "random":